@@ -2,8 +2,9 @@
 API Package
 
 Contains HTTP layer components:
-- models: Pydantic schemas for request/response validation
+- models: Pydantic request schemas and msgspec response structs
 - routes: FastAPI endpoint handlers
+- responses: Custom response classes for serialization
 
 This layer handles HTTP concerns and delegates work to the workflow layer.
 """
@@ -15,6 +16,7 @@ from .models import (
     DocumentResponse,
     StatusResponse
 )
+from .responses import MsgspecJSONResponse, MsgspecMsgPackResponse
 from .routes import RagAPI
 
 __all__ = [
@@ -23,5 +25,7 @@ __all__ = [
     "DocumentRequest",
     "DocumentResponse",
     "StatusResponse",
+    "MsgspecJSONResponse",
+    "MsgspecMsgPackResponse",
     "RagAPI"
 ]
\ No newline at end of file
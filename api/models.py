@@ -1,15 +1,29 @@
 """
 API Request/Response Models
 
-Defines Pydantic schemas for data validation and serialization.
+Defines Pydantic schemas for validating untrusted request input, and
+msgspec structs for responses built from trusted internal data.
 Separates API contracts from business logic.
 """
 
-from pydantic import BaseModel, Field
-from typing import List, Optional
+import msgspec
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Any, Dict, List, Optional, Tuple
+from typing_extensions import Annotated
 
 
-class QuestionRequest(BaseModel):
+class _RequestModel(BaseModel):
+    """
+    Base for request schemas.
+    
+    Frozen with unknown fields rejected, so Pydantic builds a lean
+    validator with no assignment validation or extra-field handling.
+    """
+    
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+
+class QuestionRequest(_RequestModel):
     """Request schema for asking questions."""
     
     question: str = Field(
@@ -18,15 +32,16 @@ class QuestionRequest(BaseModel):
         description="User question to be answered by the RAG system"
     )
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "question": "What is LangGraph?"
             }
         }
+    )
 
 
-class DocumentRequest(BaseModel):
+class DocumentRequest(_RequestModel):
     """Request schema for adding documents."""
     
     text: str = Field(
@@ -35,34 +50,77 @@ class DocumentRequest(BaseModel):
         description="Document text to be added to knowledge base"
     )
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "text": "LangGraph is a library for building stateful workflows."
             }
         }
+    )
 
 
-class QuestionResponse(BaseModel):
+class QuestionResponse(msgspec.Struct):
     """Response schema for question answering."""
     
-    question: str = Field(..., description="Original question")
-    answer: str = Field(..., description="Generated answer")
-    context_used: List[str] = Field(..., description="Retrieved context documents")
-    latency_sec: float = Field(..., description="Processing time in seconds")
+    question: Annotated[str, msgspec.Meta(description="Original question")]
+    answer: Annotated[str, msgspec.Meta(description="Generated answer")]
+    context_used: Annotated[
+        List[str], msgspec.Meta(description="Retrieved context documents")
+    ]
+    latency_sec: Annotated[
+        float, msgspec.Meta(description="Processing time in seconds")
+    ]
 
 
-class DocumentResponse(BaseModel):
+class DocumentResponse(msgspec.Struct):
     """Response schema for document addition."""
     
-    id: int = Field(..., description="Document ID")
-    status: str = Field(..., description="Operation status")
+    id: Annotated[int, msgspec.Meta(description="Document ID")]
+    status: Annotated[
+        str,
+        msgspec.Meta(
+            description="'added' if stored, 'queued' if persisted asynchronously"
+        )
+    ]
 
 
-class StatusResponse(BaseModel):
+class StatusResponse(msgspec.Struct):
     """Response schema for system status."""
     
-    qdrant_ready: bool = Field(..., description="Whether Qdrant is available")
-    storage_type: str = Field(..., description="Current storage backend")
-    document_count: int = Field(..., description="Number of documents stored")
-    graph_ready: bool = Field(..., description="Whether RAG workflow is ready")
\ No newline at end of file
+    qdrant_ready: Annotated[
+        bool, msgspec.Meta(description="Whether Qdrant is available")
+    ]
+    storage_type: Annotated[
+        str, msgspec.Meta(description="Current storage backend")
+    ]
+    document_count: Annotated[
+        int, msgspec.Meta(description="Number of documents stored")
+    ]
+    graph_ready: Annotated[
+        bool, msgspec.Meta(description="Whether RAG workflow is ready")
+    ]
+
+
+def openapi_responses(
+    model: type,
+    media_types: Tuple[str, ...] = ("application/json",),
+    status_codes: Tuple[int, ...] = (200,)
+) -> Dict[int, Dict[str, Any]]:
+    """
+    Build a FastAPI `responses` entry documenting a response struct.
+    
+    FastAPI only knows how to document Pydantic models, so the JSON
+    schema is generated by msgspec and inlined for each status code.
+    
+    Args:
+        model: msgspec.Struct response type
+        media_types: Content types the endpoint can respond with
+        status_codes: Success status codes the endpoint can return
+        
+    Returns:
+        Mapping suitable for the `responses` route argument
+    """
+    _, components = msgspec.json.schema_components([model])
+    schema = components[model.__name__]
+    content = {media_type: {"schema": schema} for media_type in media_types}
+    return {status_code: {"content": content} for status_code in status_codes}
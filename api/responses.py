@@ -0,0 +1,101 @@
+"""
+API Response Classes
+
+Custom Starlette response classes used by the HTTP layer.
+Keeps serialization details out of the endpoint handlers.
+"""
+
+from typing import Any
+
+import msgspec
+from fastapi.responses import JSONResponse, Response
+
+MSGPACK_MEDIA_TYPE = "application/x-msgpack"
+
+_encoder = msgspec.json.Encoder()
+_msgpack_encoder = msgspec.msgpack.Encoder()
+
+# Media ranges that let a client receive the JSON default
+_JSON_RANGES = ("application/json", "application/*", "*/*")
+
+
+def prefers_msgpack(accept: str) -> bool:
+    """
+    Decide from an Accept header whether to answer with MessagePack.
+
+    Args:
+        accept: Raw Accept header value
+
+    Returns:
+        True if application/x-msgpack is listed explicitly with q > 0
+        and at least the quality of any range that matches JSON
+    """
+    msgpack_q = 0.0
+    json_q = 0.0
+
+    for media_range in accept.split(","):
+        media_type, *params = media_range.split(";")
+        media_type = media_type.strip().lower()
+
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+
+        if media_type == MSGPACK_MEDIA_TYPE:
+            msgpack_q = max(msgpack_q, quality)
+        elif media_type in _JSON_RANGES:
+            json_q = max(json_q, quality)
+
+    # Wildcard aja ga cukup buat opt-in; msgpack harus diminta eksplisit
+    return msgpack_q > 0 and msgpack_q >= json_q
+
+
+class MsgspecJSONResponse(JSONResponse):
+    """
+    JSON response rendered with msgspec.
+
+    Design note: msgspec encodes Structs (and plain dicts/lists)
+    straight to bytes, skipping the model -> dict -> json round trip.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        """
+        Serialize content to JSON bytes.
+
+        Args:
+            content: msgspec.Struct or JSON-compatible Python object
+
+        Returns:
+            Encoded JSON bytes
+        """
+        return _encoder.encode(content)
+
+
+class MsgspecMsgPackResponse(Response):
+    """
+    MessagePack response rendered with msgspec.
+
+    Design note: Opt-in via `Accept: application/x-msgpack` for internal
+    clients; binary encoding avoids JSON string escaping on long context.
+    """
+
+    media_type = MSGPACK_MEDIA_TYPE
+
+    def render(self, content: Any) -> bytes:
+        """
+        Serialize content to MessagePack bytes.
+
+        Args:
+            content: msgspec.Struct or msgpack-compatible Python object
+
+        Returns:
+            Encoded MessagePack bytes
+        """
+        return _msgpack_encoder.encode(content)
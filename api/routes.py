@@ -6,7 +6,11 @@ Handles HTTP requests/responses and delegates work to workflow layer.
 """
 
 import time
+from functools import partial
+
+import anyio
 from fastapi import HTTPException
+from fastapi.responses import Response
 from typing import Dict, Any
 
 from .models import (
@@ -16,6 +20,11 @@ from .models import (
     DocumentResponse,
     StatusResponse
 )
+from .responses import (
+    MsgspecJSONResponse,
+    MsgspecMsgPackResponse,
+    prefers_msgpack
+)
 from workflows import RagWorkflow
 
 
@@ -24,9 +33,15 @@ class RagAPI:
     API handler for RAG endpoints.
     
     Design note: This class acts as a thin controller layer,
-    delegating actual work to the workflow layer.
+    delegating actual work to the workflow layer. Handlers return
+    ready-made responses so FastAPI skips re-validating models
+    we just built from trusted internal data. Blocking workflow calls
+    (embedding + Qdrant I/O) run in a worker thread so the event loop
+    stays free for other requests.
     """
     
+    __slots__ = ("workflow",)
+    
     def __init__(self, workflow: RagWorkflow):
         """
         Initialize API with RAG workflow.
@@ -36,42 +51,51 @@ class RagAPI:
         """
         self.workflow = workflow
     
-    def ask_question(self, request: QuestionRequest) -> QuestionResponse:
+    async def ask_question(
+        self, request: QuestionRequest, accept: str = ""
+    ) -> Response:
         """
         Handle question answering requests.
         
         Args:
             request: Question request with user query
+            accept: Client Accept header, used for content negotiation
             
         Returns:
-            QuestionResponse with answer and metadata
+            QuestionResponse body as MessagePack if the client accepts
+            application/x-msgpack, JSON otherwise
             
-        Raises:
-            HTTPException: If processing fails
+        Note:
+            Storage errors are already handled inside DocumentStore
+            (empty context); anything else is a bug and is left to
+            FastAPI's default 500 handler.
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
-        try:
-            # Delegate to workflow
-            result = self.workflow.run(request.question)
-            
-            # Calculate latency
-            latency = round(time.time() - start_time, 3)
-            
-            return QuestionResponse(
-                question=request.question,
-                answer=result["answer"],
-                context_used=result.get("context", []),
-                latency_sec=latency
-            )
-            
-        except Exception as e:
-            raise HTTPException(
-                status_code=500, 
-                detail=f"Error processing question: {str(e)}"
-            )
+        # Delegate to workflow (blocking, so off the event loop)
+        result = await anyio.to_thread.run_sync(
+            self.workflow.run, request.question
+        )
+        
+        # Calculate latency (monotonic clock, ms precision via int math)
+        latency = (time.perf_counter_ns() - start_ns) // 1_000_000 / 1000
+        
+        response = QuestionResponse(
+            question=request.question,
+            answer=result["answer"],
+            context_used=result["context"],
+            latency_sec=latency
+        )
+        
+        # JSON tetap default (browser, /docs); msgpack cuma kalo diminta
+        response_class = (
+            MsgspecMsgPackResponse
+            if prefers_msgpack(accept)
+            else MsgspecJSONResponse
+        )
+        return response_class(content=response, headers={"Vary": "Accept"})
     
-    def add_document(self, request: DocumentRequest) -> DocumentResponse:
+    async def add_document(self, request: DocumentRequest) -> MsgspecJSONResponse:
         """
         Handle document addition requests.
         
@@ -79,56 +103,58 @@ class RagAPI:
             request: Document request with text content
             
         Returns:
-            DocumentResponse with document ID and status
+            JSON response with DocumentResponse body: 200 "added" if
+            stored, 202 "queued" if the store persists it in a later
+            batched write
             
         Raises:
-            HTTPException: If addition fails
+            HTTPException: If the document store reports a failure
         """
-        try:
-            # Get current doc count for ID
-            stats = self.workflow.document_store.get_stats()
-            doc_id = stats["in_memory_count"]
-            
-            # Add document via workflow
-            success = self.workflow.add_document(
+        # Reserve ID up front so we can return it
+        doc_id = self.workflow.document_store.next_id()
+        
+        # Add document via workflow (blocking, so off the event loop)
+        success = await anyio.to_thread.run_sync(
+            partial(
+                self.workflow.add_document,
                 text=request.text,
                 doc_id=doc_id
             )
-            
-            if not success:
-                raise HTTPException(
-                    status_code=500,
-                    detail="Failed to add document"
-                )
-            
-            return DocumentResponse(
-                id=doc_id,
-                status="added"
-            )
-            
-        except HTTPException:
-            raise
-        except Exception as e:
+        )
+        
+        if not success:
             raise HTTPException(
                 status_code=500,
-                detail=f"Error adding document: {str(e)}"
+                detail="Failed to add document"
             )
+        
+        # Jujur soal persistence: Qdrant writes baru ke-flush nanti
+        if self.workflow.document_store.buffers_writes:
+            response = DocumentResponse(id=doc_id, status="queued")
+            return MsgspecJSONResponse(content=response, status_code=202)
+        
+        response = DocumentResponse(
+            id=doc_id,
+            status="added"
+        )
+        return MsgspecJSONResponse(content=response)
     
-    def get_status(self) -> StatusResponse:
+    async def get_status(self) -> MsgspecJSONResponse:
         """
         Get system status.
         
         Returns:
-            StatusResponse with system information
+            JSON response with StatusResponse body
         """
         stats = self.workflow.document_store.get_stats()
         
         # Determine storage type
         storage_type = "qdrant" if stats["using_qdrant"] else "in-memory"
         
-        return StatusResponse(
+        response = StatusResponse(
             qdrant_ready=stats["using_qdrant"],
             storage_type=storage_type,
             document_count=stats["in_memory_count"],
             graph_ready=self.workflow.graph is not None
-        )
\ No newline at end of file
+        )
+        return MsgspecJSONResponse(content=response)
\ No newline at end of file
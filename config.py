@@ -15,13 +15,21 @@ class Config:
     # Qdrant Configuration
     QDRANT_URL: str = os.getenv("QDRANT_URL", "http://localhost:6333")
     QDRANT_COLLECTION: str = os.getenv("QDRANT_COLLECTION", "demo_collection")
+    QDRANT_RESET: bool = os.getenv("QDRANT_RESET", "0") == "1"  # Drop collection on startup (dev)
+    
+    # Qdrant write batching: flush when batch is full or interval elapses
+    QDRANT_BATCH_SIZE: int = int(os.getenv("QDRANT_BATCH_SIZE", "64"))
+    QDRANT_FLUSH_INTERVAL_MS: int = int(os.getenv("QDRANT_FLUSH_INTERVAL_MS", "10"))
     
     # Embedding Configuration
     EMBEDDING_DIMENSION: int = int(os.getenv("EMBEDDING_DIMENSION", "128"))
+    EMBEDDING_CACHE_SIZE: int = int(os.getenv("EMBEDDING_CACHE_SIZE", "4096"))
     
     # API Configuration
     API_TITLE: str = "Learning RAG Demo"
     API_VERSION: str = "1.0.0"
+    GZIP_MINIMUM_SIZE: int = 512  # Bytes; smaller responses go uncompressed
+    GZIP_COMPRESS_LEVEL: int = 4  # Fast level, most of the size win on text
     
     # Search Configuration
     SEARCH_LIMIT: int = int(os.getenv("SEARCH_LIMIT", "2"))
@@ -38,9 +46,18 @@ class Config:
         if cls.EMBEDDING_DIMENSION <= 0:
             raise ValueError("EMBEDDING_DIMENSION must be positive")
         
+        if cls.EMBEDDING_CACHE_SIZE < 0:
+            raise ValueError("EMBEDDING_CACHE_SIZE must not be negative")
+        
         if cls.SEARCH_LIMIT <= 0:
             raise ValueError("SEARCH_LIMIT must be positive")
         
+        if cls.QDRANT_BATCH_SIZE <= 0:
+            raise ValueError("QDRANT_BATCH_SIZE must be positive")
+        
+        if cls.QDRANT_FLUSH_INTERVAL_MS < 0:
+            raise ValueError("QDRANT_FLUSH_INTERVAL_MS must not be negative")
+        
         return True
 
 
@@ -5,29 +5,52 @@ Entry point for the RAG (Retrieval-Augmented Generation) service.
 Initializes components and wires up dependencies.
 """
 
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import Response
 from config import Config
 from services import EmbeddingService, DocumentStore
 from workflows import RagWorkflow
-from api import RagAPI
+from api import RagAPI, MsgspecJSONResponse
+from api.responses import MSGPACK_MEDIA_TYPE
 from api.models import (
     QuestionRequest,
     QuestionResponse,
     DocumentRequest,
     DocumentResponse,
-    StatusResponse
+    StatusResponse,
+    openapi_responses
 )
 
+# Initialize services (dependency injection)
+embedding_service = EmbeddingService()
+document_store = DocumentStore()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """App lifecycle: flush buffered Qdrant writes on shutdown."""
+    yield
+    document_store.flush()
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title=Config.API_TITLE,
     version=Config.API_VERSION,
-    description="A simple RAG service demonstrating clean architecture principles"
+    description="A simple RAG service demonstrating clean architecture principles",
+    default_response_class=MsgspecJSONResponse,
+    lifespan=lifespan
 )
 
-# Initialize services (dependency injection)
-embedding_service = EmbeddingService()
-document_store = DocumentStore()
+# Compress larger responses (e.g. /ask with long context_used)
+app.add_middleware(
+    GZipMiddleware,
+    minimum_size=Config.GZIP_MINIMUM_SIZE,
+    compresslevel=Config.GZIP_COMPRESS_LEVEL
+)
 
 # Initialize workflow with services
 rag_workflow = RagWorkflow(
@@ -40,35 +63,49 @@ api = RagAPI(workflow=rag_workflow)
 
 
 # === ENDPOINTS ===
+# Response models are declared via `responses` for docs only;
+# handlers return prebuilt responses, skipping outbound validation.
 
-@app.post("/ask", response_model=QuestionResponse)
-def ask_question(request: QuestionRequest) -> QuestionResponse:
+@app.post(
+    "/ask",
+    responses=openapi_responses(
+        QuestionResponse, ("application/json", MSGPACK_MEDIA_TYPE)
+    )
+)
+async def ask_question(request: QuestionRequest, http_request: Request) -> Response:
     """
     Answer a question using RAG.
     
     Retrieves relevant context from the knowledge base and generates an answer.
+    Send `Accept: application/x-msgpack` to get a MessagePack body instead of JSON.
     """
-    return api.ask_question(request)
+    return await api.ask_question(
+        request, accept=http_request.headers.get("accept", "")
+    )
 
 
-@app.post("/add", response_model=DocumentResponse)
-def add_document(request: DocumentRequest) -> DocumentResponse:
+@app.post(
+    "/add",
+    responses=openapi_responses(DocumentResponse, status_codes=(200, 202))
+)
+async def add_document(request: DocumentRequest) -> MsgspecJSONResponse:
     """
     Add a document to the knowledge base.
     
     The document will be embedded and stored for future retrieval.
+    With Qdrant, writes are batched: the response is 202 "queued".
     """
-    return api.add_document(request)
+    return await api.add_document(request)
 
 
-@app.get("/status", response_model=StatusResponse)
-def get_status() -> StatusResponse:
+@app.get("/status", responses=openapi_responses(StatusResponse))
+async def get_status() -> MsgspecJSONResponse:
     """
     Get system status.
     
     Returns information about storage backend and system readiness.
     """
-    return api.get_status()
+    return await api.get_status()
 
 
 # Optional: Add root endpoint for health check
@@ -5,11 +5,85 @@ Manages document storage and retrieval using Qdrant vector database
 with in-memory fallback. Handles connection failures gracefully.
 """
 
+import itertools
+import threading
+import uuid
 from typing import List, Dict, Optional
+
+import numpy as np
+from numba import njit
 from qdrant_client import QdrantClient
+from qdrant_client.http.exceptions import (
+    ResponseHandlingException,
+    UnexpectedResponse
+)
 from qdrant_client.models import PointStruct, VectorParams, Distance
 from config import Config
 
+# Initial row capacity of the in-memory embedding matrix
+_INITIAL_CAPACITY = 16
+
+# Hot-path config, di-bind sekali pas import (skip Config attr lookup)
+_SEARCH_LIMIT = Config.SEARCH_LIMIT
+_BATCH_SIZE = Config.QDRANT_BATCH_SIZE
+_FLUSH_INTERVAL_SEC = Config.QDRANT_FLUSH_INTERVAL_MS / 1000
+
+# Errors a Qdrant RPC can raise: error status / transport failure
+_QDRANT_ERRORS = (UnexpectedResponse, ResponseHandlingException)
+
+
+@njit(cache=True, fastmath=True)
+def _cosine_scores(matrix: np.ndarray, query: np.ndarray) -> np.ndarray:
+    """
+    Compute cosine similarity between query and every row of matrix.
+
+    Args:
+        matrix: Document embeddings, shape (N, D)
+        query: Query embedding, shape (D,)
+
+    Returns:
+        float32 array of shape (N,) with similarity scores
+    """
+    n, d = matrix.shape
+
+    query_norm = 0.0
+    for j in range(d):
+        query_norm += query[j] * query[j]
+    query_norm = np.sqrt(query_norm)
+
+    scores = np.empty(n, dtype=np.float32)
+    for i in range(n):
+        dot = 0.0
+        norm = 0.0
+        for j in range(d):
+            value = matrix[i, j]
+            dot += value * query[j]
+            norm += value * value
+
+        denom = np.sqrt(norm) * query_norm
+        scores[i] = dot / denom if denom > 0.0 else 0.0
+
+    return scores
+
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Indices of the k highest scores, best first.
+
+    Args:
+        scores: Similarity scores
+        k: Number of indices to return
+
+    Returns:
+        Array of row indices sorted by descending score
+    """
+    if k >= len(scores):
+        return np.argsort(-scores, kind="stable")
+
+    # argpartition = O(N), cuma sort k teratas
+    top = np.argpartition(-scores, k)[:k]
+    return top[np.argsort(-scores[top], kind="stable")]
+
 
 class DocumentStore:
     """
@@ -19,8 +93,28 @@ class DocumentStore:
     - Graceful degradation: kalo Qdrant fail, pake in-memory
     - Encapsulates storage logic: API layer ga perlu tau detail storage
     - Single responsibility: cuma ngurus storage, bukan business logic
+    - In-memory fallback disimpan SoA: satu matrix (N, D) contiguous
+      buat embeddings + list texts, biar search cuma satu scan
+    - Qdrant writes di-buffer, terus di-upsert per batch biar
+      round-trip HTTP-nya ga satu per document
     """
     
+    __slots__ = (
+        "qdrant_url",
+        "collection_name",
+        "using_qdrant",
+        "client",
+        "_embeddings",
+        "_texts",
+        "_size",
+        "_lock",
+        "_pending",
+        "_pending_lock",
+        "_flush_timer",
+        "_id_counter",
+        "_static_stats",
+    )
+    
     def __init__(self, qdrant_url: str = None, collection_name: str = None):
         """
         Initialize document store.
@@ -32,27 +126,56 @@ class DocumentStore:
         self.qdrant_url = qdrant_url or Config.QDRANT_URL
         self.collection_name = collection_name or Config.QDRANT_COLLECTION
         self.using_qdrant = False
-        self.memory_store: List[Dict] = []  # Fallback storage
+        
+        # Fallback storage (SoA, capacity tumbuh 2x kalo penuh)
+        self._embeddings = np.empty(
+            (_INITIAL_CAPACITY, Config.EMBEDDING_DIMENSION), dtype=np.float32
+        )
+        self._texts: List[str] = []
+        self._size = 0
+        self._lock = threading.Lock()
+        
+        # Pending Qdrant points, flushed by size or timer
+        self._pending: List[PointStruct] = []
+        self._pending_lock = threading.Lock()
+        self._flush_timer: Optional[threading.Timer] = None
+        
+        # Sequential doc IDs for the in-memory backend (single process)
+        self._id_counter = itertools.count()
         
         # Try connect to Qdrant
         self._initialize_qdrant()
+        
+        # Stats yang ga berubah setelah init, dihitung sekali aja
+        self._static_stats = {
+            "using_qdrant": self.using_qdrant,
+            "qdrant_url": self.qdrant_url if self.using_qdrant else None,
+            "collection_name": self.collection_name if self.using_qdrant else None
+        }
     
     def _initialize_qdrant(self) -> None:
         """
         Setup Qdrant connection and collection.
+        Reuses an existing collection unless QDRANT_RESET is set.
         Falls back to in-memory if connection fails.
         """
         try:
             self.client = QdrantClient(self.qdrant_url)
             
-            # Recreate collection (fresh start tiap run)
-            self.client.recreate_collection(
-                collection_name=self.collection_name,
-                vectors_config=VectorParams(
-                    size=Config.EMBEDDING_DIMENSION,
-                    distance=Distance.COSINE
+            # Reset cuma kalo diminta (dev); default-nya data lama dipertahankan
+            if Config.QDRANT_RESET:
+                self.client.delete_collection(self.collection_name)
+            
+            if not self.client.collection_exists(self.collection_name):
+                self.client.create_collection(
+                    collection_name=self.collection_name,
+                    vectors_config=VectorParams(
+                        size=Config.EMBEDDING_DIMENSION,
+                        distance=Distance.COSINE
+                    )
                 )
-            )
+            else:
+                self._check_vector_size()
             
             self.using_qdrant = True
             print(f"✅ Qdrant connected at {self.qdrant_url}")
@@ -62,7 +185,44 @@ class DocumentStore:
             print("📝 Using in-memory storage as fallback")
             self.using_qdrant = False
     
-    def add_document(self, doc_id: int, text: str, embedding: List[float]) -> bool:
+    def _check_vector_size(self) -> None:
+        """
+        Verify a reused collection matches EMBEDDING_DIMENSION.
+        
+        Raises:
+            ValueError: If the collection stores vectors of another size
+            
+        Note:
+            Kalo beda, semua upsert bakal gagal di flush (ke-buffer,
+            jadi ga keliatan), mending ketahuan dari startup.
+        """
+        info = self.client.get_collection(self.collection_name)
+        size = getattr(info.config.params.vectors, "size", None)
+        if size != Config.EMBEDDING_DIMENSION:
+            raise ValueError(
+                f"collection '{self.collection_name}' has vector size {size}, "
+                f"expected EMBEDDING_DIMENSION={Config.EMBEDDING_DIMENSION} "
+                "(set QDRANT_RESET=1 to recreate it)"
+            )
+    
+    def next_id(self) -> int:
+        """
+        Reserve the next document ID.
+        
+        Returns:
+            Unique document ID
+            
+        Note:
+            Qdrant collection di-share semua worker/process dan data-nya
+            persist, jadi ID-nya random 63-bit (uuid4) biar ga tabrakan.
+            In-memory cuma satu process: itertools.count cukup (atomic
+            under the GIL).
+        """
+        if self.using_qdrant:
+            return uuid.uuid4().int >> 65
+        return next(self._id_counter)
+    
+    def add_document(self, doc_id: int, text: str, embedding: np.ndarray) -> bool:
         """
         Add document to storage.
         
@@ -71,35 +231,142 @@ class DocumentStore:
             text: Document text content
             embedding: Vector embedding of the text
             
+        Returns:
+            True if stored (in-memory) or queued for Qdrant
+            
+        Note:
+            Qdrant writes are deferred (see buffers_writes). Failed
+            upserts stay queued and are retried on the next flush.
+        """
+        if self.using_qdrant:
+            point = PointStruct(
+                id=doc_id,
+                vector=embedding.tolist(),
+                payload={"text": text}
+            )
+            self._enqueue_point(point)
+            return True
+        
+        # Fallback: store in memory
+        self._append_memory(text, embedding)
+        return True
+    
+    @property
+    def buffers_writes(self) -> bool:
+        """Whether add_document defers persistence to a batched flush."""
+        return self.using_qdrant
+    
+    def _enqueue_point(self, point: PointStruct) -> None:
+        """
+        Buffer a point for the next batched Qdrant upsert.
+        
+        Args:
+            point: Point to upsert
+            
+        Note:
+            Flush selalu jalan di timer thread, bukan di thread caller:
+            kalo batch penuh langsung di-schedule, kalo belum ditunggu
+            QDRANT_FLUSH_INTERVAL_MS.
+        """
+        with self._pending_lock:
+            self._pending.append(point)
+            if len(self._pending) >= _BATCH_SIZE:
+                self._schedule_flush(0)
+            elif self._flush_timer is None:
+                self._schedule_flush(_FLUSH_INTERVAL_SEC)
+    
+    def _schedule_flush(self, delay: float) -> None:
+        """
+        (Re)start the background flush timer. Caller must hold _pending_lock.
+        
+        Args:
+            delay: Seconds until flush runs
+        """
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+        self._flush_timer = threading.Timer(delay, self.flush)
+        self._flush_timer.daemon = True
+        self._flush_timer.start()
+    
+    def _take_pending(self) -> List[PointStruct]:
+        """
+        Swap out the pending buffer. Caller must hold _pending_lock.
+        
+        Returns:
+            Points that were pending
+        """
+        batch, self._pending = self._pending, []
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        return batch
+    
+    def _upsert(self, points: List[PointStruct]) -> bool:
+        """
+        Write a batch of points to Qdrant in one request.
+        
+        Args:
+            points: Points to upsert
+            
         Returns:
             True if successful, False otherwise
         """
         try:
-            if self.using_qdrant:
-                point = PointStruct(
-                    id=doc_id,
-                    vector=embedding,
-                    payload={"text": text}
-                )
-                self.client.upsert(
-                    collection_name=self.collection_name,
-                    points=[point]
-                )
-            else:
-                # Fallback: store in memory
-                self.memory_store.append({
-                    "id": doc_id,
-                    "text": text,
-                    "embedding": embedding
-                })
-            
+            self.client.upsert(
+                collection_name=self.collection_name,
+                points=points
+            )
             return True
             
-        except Exception as e:
-            print(f"❌ Error adding document: {e}")
+        except _QDRANT_ERRORS as e:
+            print(f"❌ Error upserting {len(points)} documents: {e}")
             return False
     
-    def search(self, query_embedding: List[float], limit: int = None) -> List[str]:
+    def flush(self) -> bool:
+        """
+        Upsert all buffered points to Qdrant now.
+        
+        Returns:
+            True if nothing was pending or the upsert succeeded
+            
+        Note:
+            Kalo upsert gagal, batch dibalikin ke depan queue biar
+            ga hilang; di-retry sama flush berikutnya (add baru,
+            search, atau shutdown).
+        """
+        with self._pending_lock:
+            batch = self._take_pending()
+        
+        if not batch or self._upsert(batch):
+            return True
+        
+        with self._pending_lock:
+            self._pending[:0] = batch
+        return False
+    
+    def _append_memory(self, text: str, embedding: np.ndarray) -> None:
+        """
+        Append one document to the in-memory SoA storage.
+        
+        Args:
+            text: Document text content
+            embedding: Vector embedding of the text
+        """
+        with self._lock:
+            if self._size == len(self._embeddings):
+                # Penuh: double capacity biar append tetap amortized O(1)
+                grown = np.empty(
+                    (2 * len(self._embeddings), self._embeddings.shape[1]),
+                    dtype=np.float32
+                )
+                grown[:self._size] = self._embeddings[:self._size]
+                self._embeddings = grown
+            
+            self._embeddings[self._size] = embedding
+            self._texts.append(text)
+            self._size += 1
+    
+    def search(self, query_embedding: np.ndarray, limit: int = None) -> List[str]:
         """
         Search for similar documents.
         
@@ -110,30 +377,35 @@ class DocumentStore:
         Returns:
             List of matching document texts
         """
-        limit = limit or Config.SEARCH_LIMIT
-        results = []
+        limit = limit or _SEARCH_LIMIT
         
-        try:
-            if self.using_qdrant:
-                # Vector search pake Qdrant
-                hits = self.client.search(
-                    collection_name=self.collection_name,
-                    query_vector=query_embedding,
-                    limit=limit
-                )
-                results = [hit.payload["text"] for hit in hits]
-                
-            else:
-                # Fallback: simple text matching (ga pake similarity score)
-                # Note: ini simple banget, real case harusnya pake cosine similarity
-                for doc in self.memory_store[:limit]:
-                    results.append(doc["text"])
-            
-            return results
+        if self.using_qdrant:
+            # Flush dulu biar document yang baru di-add ikut ke-search
+            self.flush()
             
-        except Exception as e:
-            print(f"❌ Error searching: {e}")
+            # Vector search pake Qdrant; cuma minta payload "text",
+            # vector-nya ga usah dikirim balik
+            try:
+                hits = self.client.query_points(
+                    collection_name=self.collection_name,
+                    query=query_embedding.tolist(),
+                    limit=limit,
+                    with_vectors=False,
+                    with_payload=["text"]
+                ).points
+            except _QDRANT_ERRORS as e:
+                print(f"❌ Error searching: {e}")
+                return []
+            return [hit.payload["text"] for hit in hits]
+        
+        if not self._size:
             return []
+        
+        # Fallback: cosine similarity, JIT-compiled via Numba
+        size = self._size
+        query = np.asarray(query_embedding, dtype=np.float32)
+        scores = _cosine_scores(self._embeddings[:size], query)
+        return [self._texts[i] for i in _top_k(scores, limit)]
     
     def get_stats(self) -> Dict:
         """
@@ -142,9 +414,4 @@ class DocumentStore:
         Returns:
             Dict containing storage info
         """
-        return {
-            "using_qdrant": self.using_qdrant,
-            "qdrant_url": self.qdrant_url if self.using_qdrant else None,
-            "collection_name": self.collection_name if self.using_qdrant else None,
-            "in_memory_count": len(self.memory_store)
-        }
\ No newline at end of file
+        return {**self._static_stats, "in_memory_count": self._size}
\ No newline at end of file
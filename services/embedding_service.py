@@ -6,8 +6,12 @@ fake embedding for demo purposes, but designed to be easily swapped
 with real models (OpenAI, HuggingFace, etc.)
 """
 
-import random
+from functools import lru_cache
 from typing import List
+
+import numpy as np
+import xxhash
+
 from config import Config
 
 
@@ -19,16 +23,25 @@ class EmbeddingService:
     dari fake embedding ke real model (e.g., sentence-transformers).
     """
     
-    def __init__(self, dimension: int = None):
+    __slots__ = ("dimension", "_cached_embed")
+    
+    def __init__(self, dimension: int = None, cache_size: int = None):
         """
         Initialize embedding service.
         
         Args:
             dimension: Vector dimension. Defaults to config value.
+            cache_size: Max cached embeddings (0 disables). Defaults to
+                config value.
         """
         self.dimension = dimension or Config.EMBEDDING_DIMENSION
+        
+        if cache_size is None:
+            cache_size = Config.EMBEDDING_CACHE_SIZE
+        # Per-instance LRU (thread-safe), key-nya text itu sendiri
+        self._cached_embed = lru_cache(maxsize=cache_size)(self._compute_embedding)
     
-    def embed(self, text: str) -> List[float]:
+    def embed(self, text: str) -> np.ndarray:
         """
         Convert text to embedding vector.
         
@@ -36,17 +49,37 @@ class EmbeddingService:
             text: Input text to embed
             
         Returns:
-            List of floats representing the embedding vector
+            Read-only float32 array of shape (dimension,)
             
         Note:
             Currently uses deterministic random for demo.
-            Seed based on text hash ensures same text = same vector.
+            Seed based on a stable content hash ensures same text =
+            same vector across processes, so repeated texts are served
+            from the LRU cache and stored Qdrant vectors stay valid.
         """
-        # Seed berdasarkan hash text biar deterministic
-        random.seed(abs(hash(text)) % 10000)
-        return [random.random() for _ in range(self.dimension)]
+        return self._cached_embed(text)
+    
+    def _compute_embedding(self, text: str) -> np.ndarray:
+        """
+        Compute embedding without caching.
+        
+        Args:
+            text: Input text to embed
+            
+        Returns:
+            Read-only float32 array of shape (dimension,)
+        """
+        # Seed dari xxh3 content hash: beda sama hash() bawaan yang
+        # di-salt per process, hasilnya stabil antar restart/worker
+        seed = xxhash.xxh3_64_intdigest(text.encode("utf-8"))
+        rng = np.random.default_rng(seed)
+        embedding = rng.random(self.dimension, dtype=np.float32)
+        
+        # Array di-share lewat cache, jadi jangan sampai ke-mutate
+        embedding.flags.writeable = False
+        return embedding
     
-    def embed_batch(self, texts: List[str]) -> List[List[float]]:
+    def embed_batch(self, texts: List[str]) -> np.ndarray:
         """
         Embed multiple texts at once.
         
@@ -54,9 +87,12 @@ class EmbeddingService:
             texts: List of texts to embed
             
         Returns:
-            List of embedding vectors
+            float32 array of shape (len(texts), dimension)
             
         Note:
-            Useful untuk batch processing documents.
+            Useful untuk batch processing documents. Each row keeps its
+            own per-text seed so batch output matches embed().
         """
-        return [self.embed(text) for text in texts]
\ No newline at end of file
+        if not texts:
+            return np.empty((0, self.dimension), dtype=np.float32)
+        return np.stack([self.embed(text) for text in texts])
\ No newline at end of file
@@ -9,11 +9,68 @@ This workflow uses LangGraph for state management but keeps
 the business logic simple and testable.
 """
 
-from typing import Dict, List, Any
+from functools import lru_cache
+from typing import List, Any
+from typing_extensions import TypedDict
+from langchain_core.runnables import RunnableConfig
 from langgraph.graph import StateGraph, END
 from services import EmbeddingService, DocumentStore
 from config import Config
 
+# Hot-path config, di-bind sekali pas import (skip Config attr lookup)
+_SEARCH_LIMIT = Config.SEARCH_LIMIT
+_PREVIEW_LENGTH = Config.ANSWER_PREVIEW_LENGTH
+
+
+class RagState(TypedDict, total=False):
+    """
+    Workflow state passed between graph nodes.
+
+    'question' di-set sama run(), 'context' sama retrieve,
+    'answer' sama answer step.
+    """
+
+    question: str
+    context: List[str]
+    answer: str
+
+
+def _retrieve_node(state: RagState, config: RunnableConfig) -> RagState:
+    """Graph node: delegate to the RagWorkflow passed in run config."""
+    return config["configurable"]["workflow"]._retrieve_step(state)
+
+
+def _answer_node(state: RagState, config: RunnableConfig) -> RagState:
+    """Graph node: delegate to the RagWorkflow passed in run config."""
+    return config["configurable"]["workflow"]._answer_step(state)
+
+
+@lru_cache(maxsize=None)
+def _build_graph() -> Any:
+    """
+    Build LangGraph workflow.
+
+    Returns:
+        Compiled workflow graph
+
+    Note:
+        Topology-nya statis, jadi compile sekali per process dan di-share
+        semua RagWorkflow instance. Nodes ga nge-bind `self`; instance
+        yang aktif dikirim lewat config["configurable"]["workflow"].
+    """
+    workflow = StateGraph(RagState)
+
+    # Add nodes (module-level, resolve workflow dari config)
+    workflow.add_node("retrieve", _retrieve_node)
+    workflow.add_node("answer", _answer_node)
+
+    # Define flow
+    workflow.set_entry_point("retrieve")
+    workflow.add_edge("retrieve", "answer")
+    workflow.add_edge("answer", END)
+
+    return workflow.compile()
+
 
 class RagWorkflow:
     """
@@ -23,6 +80,8 @@ class RagWorkflow:
     business logic itself - that's in the services layer.
     """
 
+    __slots__ = ("embedding_service", "document_store", "graph", "_run_config")
+
     def __init__(
         self, embedding_service: EmbeddingService, document_store: DocumentStore
     ):
@@ -35,29 +94,12 @@ class RagWorkflow:
         """
         self.embedding_service = embedding_service
         self.document_store = document_store
-        self.graph = self._build_graph()
-
-    def _build_graph(self) -> Any:
-        """
-        Build LangGraph workflow.
-
-        Returns:
-            Compiled workflow graph
-        """
-        workflow = StateGraph(dict)
-
-        # Add nodes dengan bound methods
-        workflow.add_node("retrieve", self._retrieve_step)
-        workflow.add_node("answer", self._answer_step)
-
-        # Define flow
-        workflow.set_entry_point("retrieve")
-        workflow.add_edge("retrieve", "answer")
-        workflow.add_edge("answer", END)
+        self.graph = _build_graph()
 
-        return workflow.compile()
+        # Run config yang bikin shared graph manggil instance ini
+        self._run_config: RunnableConfig = {"configurable": {"workflow": self}}
 
-    def _retrieve_step(self, state: Dict[str, Any]) -> Dict[str, Any]:
+    def _retrieve_step(self, state: RagState) -> RagState:
         """
         Step 1: Retrieve relevant documents.
 
@@ -65,22 +107,22 @@ class RagWorkflow:
             state: Current workflow state containing 'question'
 
         Returns:
-            Updated state with 'context' field
+            State update with 'context' field
         """
-        question = state.get("question", "")
+        question = state["question"]
 
         # Generate query embedding
         query_embedding = self.embedding_service.embed(question)
 
         # Search for relevant docs
         results = self.document_store.search(
-            query_embedding=query_embedding, limit=Config.SEARCH_LIMIT
+            query_embedding=query_embedding, limit=_SEARCH_LIMIT
         )
 
-        state["context"] = results
-        return state
+        # Cukup return key yang berubah, LangGraph yang merge ke state
+        return {"context": results}
 
-    def _answer_step(self, state: Dict[str, Any]) -> Dict[str, Any]:
+    def _answer_step(self, state: RagState) -> RagState:
         """
         Step 2: Generate answer from context.
 
@@ -88,28 +130,26 @@ class RagWorkflow:
             state: Current workflow state containing 'context'
 
         Returns:
-            Updated state with 'answer' field
+            State update with 'answer' field
         """
-        context = state.get("context", [])
+        context = state["context"]
 
         if context:
             # Ambil context pertama dan preview
-            preview_length = Config.ANSWER_PREVIEW_LENGTH
             first_context = context[0]
 
             # Truncate kalo kepanjangan
-            preview = first_context[:preview_length]
-            if len(first_context) > preview_length:
+            preview = first_context[:_PREVIEW_LENGTH]
+            if len(first_context) > _PREVIEW_LENGTH:
                 preview += "..."
 
             answer = f"I found this: '{preview}'"
         else:
             answer = "Sorry, I don't know."
 
-        state["answer"] = answer
-        return state
+        return {"answer": answer}
 
-    def run(self, question: str) -> Dict[str, Any]:
+    def run(self, question: str) -> RagState:
         """
         Execute the RAG workflow.
 
@@ -117,11 +157,9 @@ class RagWorkflow:
             question: User question
 
         Returns:
-            Dict containing answer and context used
+            Final state containing question, context and answer
         """
-        initial_state = {"question": question}
-        result = self.graph.invoke(initial_state)
-        return result
+        return self.graph.invoke({"question": question}, config=self._run_config)
 
     def add_document(self, text: str, doc_id: int = None) -> bool:
         """
@@ -140,8 +178,7 @@ class RagWorkflow:
         """
         # Auto-generate ID if not provided
         if doc_id is None:
-            stats = self.document_store.get_stats()
-            doc_id = stats["in_memory_count"]
+            doc_id = self.document_store.next_id()
 
         # Generate embedding
         embedding = self.embedding_service.embed(text)